@@ -0,0 +1,180 @@
+"""
+Shared plumbing for validate_imports.py and validate_structure.py.
+
+File discovery, parsing, the per-file result cache, parallel mapping and
+the mypyc launcher live here, so a fix applies to both validators at once.
+The validators import this module from their own directory, which is first
+on sys.path when they run as scripts.
+
+Per-file results are cached in .validator_cache.sqlite under the source
+directory, one table per validator, so unchanged files are not re-parsed on
+later runs. Entries for files that no longer exist are dropped on each run.
+Add the file to the project's .gitignore; deleting it is always safe.
+
+For a further speedup, compile the validators with mypyc (pip install mypy)
+from this directory; the compiled modules are used automatically:
+    mypyc _validator_common.py validate_imports.py validate_structure.py
+Re-run mypyc after editing any of them: a compiled build, when present, is
+preferred over the source, so a stale one would ignore the edits.
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.machinery
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+# Directories never worth descending into
+PRUNED_DIRS = ('__pycache__', '.git', 'node_modules')
+
+# Test directories, pruned along with their subtree: tests/, test/ and test_*/
+TEST_DIRS = frozenset({'test', 'tests'})
+
+# AST-only compile flags; PyCF_OPTIMIZED_AST (Python 3.13+) also folds constants
+PARSE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, 'PyCF_OPTIMIZED_AST', 0)
+
+# Result cache location (relative to the validated root)
+CACHE_FILE = '.validator_cache.sqlite'
+
+# Below this many files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Files handed to a worker per task, to amortize inter-process overhead
+PARALLEL_CHUNKSIZE = 32
+
+
+def scandir_py(path: Union[str, Path]) -> Iterator[str]:
+    """Yield Python file paths under path, pruning skipped directories whole."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Match test directories by name only, so latest/ or contest/ are still scanned
+                name = entry.name
+                if name in PRUNED_DIRS or name in TEST_DIRS or name.startswith('test_'):
+                    continue
+                yield from scandir_py(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
+
+def parse(source: bytes, filename: str) -> ast.AST:
+    """Parse source to an AST, constant-folded where the interpreter supports it."""
+    return compile(source, filename, 'exec', flags=PARSE_FLAGS, dont_inherit=True)
+
+
+class ResultCache:
+    """Per-file results persisted in SQLite, keyed by path and content hash.
+
+    Any SQLite failure (e.g. a read-only project directory) disables the
+    cache for the rest of the run instead of failing validation.
+    """
+
+    def __init__(self, root_path: Path, table: str):
+        self._table = table
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            conn = sqlite3.connect(os.path.join(root_path, CACHE_FILE))
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(path TEXT PRIMARY KEY, sha TEXT NOT NULL, result TEXT NOT NULL)"
+            )
+            self._conn = conn
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def digest(source: bytes) -> str:
+        """Hash file content for use as a cache key."""
+        return hashlib.sha256(source, usedforsecurity=False).hexdigest()
+
+    def shas(self) -> Dict[str, str]:
+        """Return the content hash stored for every cached path."""
+        if self._conn is None:
+            return {}
+        try:
+            return dict(self._conn.execute(f"SELECT path, sha FROM {self._table}"))
+        except sqlite3.Error:
+            self._conn = None
+            return {}
+
+    def prune(self, paths: Iterable[str]) -> None:
+        """Drop the stored results for paths, e.g. files deleted or renamed since."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.executemany(
+                f"DELETE FROM {self._table} WHERE path = ?", ((path,) for path in paths)
+            )
+        except sqlite3.Error:
+            self._conn = None
+
+    def get(self, path: str, sha: str) -> Any:
+        """Return the stored result for path if its content is unchanged."""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                f"SELECT result FROM {self._table} WHERE path = ? AND sha = ?",
+                (path, sha),
+            ).fetchone()
+        except sqlite3.Error:
+            self._conn = None
+            return None
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            # A corrupt or hand-edited row is a miss; put() overwrites it
+            return None
+
+    def put(self, path: str, sha: str, result: Any) -> None:
+        """Store the result for path, replacing any stale entry."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (path, sha, result) VALUES (?, ?, ?)",
+                (path, sha, json.dumps(result)),
+            )
+        except sqlite3.Error:
+            self._conn = None
+
+    def close(self) -> None:
+        """Commit pending results and close the database."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+
+def map_files(func: Callable[[str, Optional[str]], Any], file_paths: List[str],
+              cached_shas: List[Optional[str]]) -> Iterable[Any]:
+    """Apply func(path, cached_sha) to each file, in worker processes for large trees."""
+    if len(file_paths) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        return map(func, file_paths, cached_shas)
+
+    with ProcessPoolExecutor() as executor:
+        # Collected before the pool shuts down; compiled generators can't safely wrap it
+        return list(executor.map(func, file_paths, cached_shas, chunksize=PARALLEL_CHUNKSIZE))
+
+
+def compiled_main(module: str, main: Callable[[], None]) -> Callable[[], None]:
+    """Return module's main() from a mypyc-compiled build in this directory, else main."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        if os.path.exists(os.path.join(here, module + suffix)):
+            # The scripts' directory is first on sys.path, and extension
+            # modules take precedence over the .py source there
+            compiled: Callable[[], None] = importlib.import_module(module).main
+            return compiled
+    return main
@@ -7,19 +7,51 @@ Frameworks → Infrastructure → Application → Domain
 
 Usage:
     python validate_imports.py [path_to_src]
+
+Per-file results are cached in .validator_cache.sqlite under the source
+directory (add it to the project's .gitignore), and the validators can be
+compiled with mypyc for speed; see _validator_common.py for both.
 """
 
 import ast
 import sys
 import os
 from pathlib import Path
-from typing import List, Tuple, Set, Dict
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
+
+from _validator_common import ResultCache, compiled_main, map_files, parse, scandir_py
+
+# AST fields that hold nested statement blocks
+BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+# Bump when the cached result format or extraction logic changes
+CACHE_TABLE = 'imports_v1'
+
+
+def _extract_one(file_path: str, cached_sha: Optional[str] = None) -> Dict[str, Any]:
+    """Read and parse one file, returning its imports; runs in worker processes.
+
+    The result holds the content hash ('sha'), the sorted imports
+    ('imports') and a parse error message ('error'). When the hash matches
+    cached_sha the file is not parsed and 'imports' is None.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            source = f.read()
+        sha = ResultCache.digest(source)
+        if sha == cached_sha:
+            return {'sha': sha, 'imports': None, 'error': None}
+        tree = parse(source, file_path)
+        imports = sorted(ImportValidator._extract_imports(tree))
+        return {'sha': sha, 'imports': imports, 'error': None}
+    except Exception as e:
+        return {'sha': None, 'imports': None, 'error': str(e)}
 
 
 class ImportValidator:
     """Validates imports follow Clean Architecture rules."""
 
-    LAYERS = {
+    LAYERS: ClassVar[Dict[str, int]] = {
         'domain': 0,
         'application': 1,
         'infrastructure': 2,
@@ -30,17 +62,47 @@ class ImportValidator:
         'entities': 0,   # Alternative naming
     }
 
+    # Violations kept for reporting; any beyond this are only counted
+    MAX_ISSUES: ClassVar[int] = 50
+
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.violations: List[Tuple[str, str, str]] = []
+        self._overflow = 0
+        # Discovered paths all start with this prefix, so slicing it off gives
+        # the path relative to root without building Path objects
+        self._prefix_len = len(os.path.join(root_path, ''))
 
     def validate(self) -> bool:
         """Validate all Python files in the project."""
         print(f"Validating imports in: {self.root_path}")
         print("-" * 50)
 
+        # Decide from the path alone which files need reading: skip test files
+        # (test directories are pruned during discovery) and files outside a layer
+        py_files: List[str] = []
+        targets: List[Tuple[str, int]] = []
         for py_file in self._find_python_files():
-            self._validate_file(py_file)
+            if 'test' in os.path.basename(py_file):
+                continue
+            relative_path = py_file[self._prefix_len:]
+            file_layer = self._match_layer(relative_path.split(os.sep))
+            if file_layer is None:
+                continue
+            py_files.append(py_file)
+            targets.append((relative_path, file_layer))
+
+        cache = ResultCache(self.root_path, CACHE_TABLE)
+        try:
+            cached_shas = cache.shas()
+            # Files not seen this run were deleted or moved (or are now skipped)
+            cache.prune(cached_shas.keys() - set(py_files))
+            shas = [cached_shas.get(py_file) for py_file in py_files]
+            results = map_files(_extract_one, py_files, shas)
+            for py_file, (relative_path, file_layer), result in zip(py_files, targets, results):
+                self._validate_file(cache, py_file, relative_path, file_layer, result)
+        finally:
+            cache.close()
 
         if self.violations:
             self._report_violations()
@@ -49,58 +111,65 @@ class ImportValidator:
             print("✅ All imports follow Clean Architecture rules!")
             return True
 
-    def _find_python_files(self) -> List[Path]:
+    def _find_python_files(self) -> Iterator[str]:
         """Find all Python files in the project."""
-        return list(self.root_path.rglob("*.py"))
+        return scandir_py(self.root_path)
 
-    def _validate_file(self, file_path: Path) -> None:
-        """Validate imports in a single file."""
-        # Skip test files and __pycache__
-        if '__pycache__' in str(file_path) or 'test' in str(file_path):
+    def _validate_file(self, cache: ResultCache, file_path: str, relative_path: str,
+                       file_layer: int, result: Dict[str, Any]) -> None:
+        """Validate the imports extracted from a single file."""
+        if result['error'] is not None:
+            print(f"Warning: Could not parse {file_path}: {result['error']}")
             return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
-
-            file_layer = self._get_layer(file_path)
-            if file_layer is None:
-                return  # File not in a recognized layer
-
-            imports = self._extract_imports(tree)
-            for import_path in imports:
-                self._check_import(file_path, file_layer, import_path)
-
-        except Exception as e:
-            print(f"Warning: Could not parse {file_path}: {e}")
+        imports = result['imports']
+        if imports is None:
+            # Unchanged since it was cached; fall back to parsing if the row is gone
+            imports = cache.get(file_path, result['sha'])
+            if imports is None:
+                return self._validate_file(
+                    cache, file_path, relative_path, file_layer, _extract_one(file_path)
+                )
+        else:
+            cache.put(file_path, result['sha'], imports)
 
-    def _get_layer(self, file_path: Path) -> int:
-        """Determine which layer a file belongs to."""
-        relative_path = file_path.relative_to(self.root_path)
-        parts = relative_path.parts
+        for import_path in imports:
+            self._check_import(relative_path, file_layer, import_path)
 
+    def _match_layer(self, parts: Sequence[str]) -> Optional[int]:
+        """Return the layer of the first part naming one, ignoring case."""
+        layers = self.LAYERS
         for part in parts:
-            layer_name = part.lower()
-            if layer_name in self.LAYERS:
-                return self.LAYERS[layer_name]
-
+            # Layer keys are lowercase, so only lowercase parts that aren't already
+            layer = layers.get(part)
+            if layer is None and not part.islower():
+                layer = layers.get(part.lower())
+            if layer is not None:
+                return layer
         return None
 
-    def _extract_imports(self, tree: ast.AST) -> Set[str]:
+    @staticmethod
+    def _extract_imports(tree: ast.AST) -> Set[str]:
         """Extract all imports from an AST."""
         imports = set()
 
-        for node in ast.walk(tree):
+        # Imports are statements, so only nested statement blocks need visiting
+        stack = [tree]
+        while stack:
+            node = stack.pop()
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.add(alias.name)
             elif isinstance(node, ast.ImportFrom):
                 if node.module:
                     imports.add(node.module)
+            else:
+                for field in BLOCK_FIELDS:
+                    stack.extend(getattr(node, field, ()))
 
         return imports
 
-    def _check_import(self, file_path: Path, file_layer: int, import_path: str) -> None:
+    def _check_import(self, relative_path: str, file_layer: int, import_path: str) -> None:
         """Check if an import violates dependency rules."""
         # Skip standard library and third-party imports
         if not self._is_project_import(import_path):
@@ -112,8 +181,12 @@ class ImportValidator:
 
         # Check dependency rule: can only import from same or inner layers
         if import_layer > file_layer:
+            if len(self.violations) >= self.MAX_ISSUES:
+                self._overflow += 1
+                return
+
             violation = (
-                str(file_path.relative_to(self.root_path)),
+                relative_path,
                 self._get_layer_name(file_layer),
                 self._get_layer_name(import_layer)
             )
@@ -122,17 +195,12 @@ class ImportValidator:
     def _is_project_import(self, import_path: str) -> bool:
         """Check if an import is from the project (not stdlib or third-party)."""
         # Check if import matches any layer name
-        first_part = import_path.split('.')[0].lower()
-        return first_part in self.LAYERS
+        first_part = import_path.partition('.')[0]
+        return self._match_layer((first_part,)) is not None
 
-    def _get_import_layer(self, import_path: str) -> int:
+    def _get_import_layer(self, import_path: str) -> Optional[int]:
         """Get the layer of an imported module."""
-        parts = import_path.split('.')
-        for part in parts:
-            layer_name = part.lower()
-            if layer_name in self.LAYERS:
-                return self.LAYERS[layer_name]
-        return None
+        return self._match_layer(import_path.split('.'))
 
     def _get_layer_name(self, layer_index: int) -> str:
         """Get the name of a layer by its index."""
@@ -154,7 +222,11 @@ class ImportValidator:
             print(f"    ✗ Dependencies must flow inward!")
             print()
 
-        print(f"Total violations: {len(self.violations)}")
+        if self._overflow:
+            print(f"  ... and {self._overflow} more")
+            print()
+
+        print(f"Total violations: {len(self.violations) + self._overflow}")
         print("\nHow to fix:")
         print("- Domain should not import from any outer layer")
         print("- Application should only import from Domain")
@@ -165,7 +237,7 @@ class ImportValidator:
 class LayerStructureValidator:
     """Validates that files are in the correct layers."""
 
-    EXPECTED_CONTENTS = {
+    EXPECTED_CONTENTS: ClassVar[Dict[str, List[str]]] = {
         'domain': [
             'entities', 'value_objects', 'services', 'repositories',
             'exceptions', 'events', 'specifications'
@@ -183,6 +255,18 @@ class LayerStructureValidator:
         ]
     }
 
+    # Subdirectories that suggest misplaced code, with where it likely belongs
+    SUSPICIOUS_SUBDIRS: ClassVar[Dict[str, Tuple[FrozenSet[str], str]]] = {
+        'domain': (
+            frozenset({'controllers', 'routers', 'api', 'database', 'orm'}),
+            'an outer layer',
+        ),
+        'application': (
+            frozenset({'models', 'database', 'orm', 'api', 'controllers'}),
+            'another layer',
+        ),
+    }
+
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.issues: List[str] = []
@@ -211,24 +295,19 @@ class LayerStructureValidator:
         subdirs = [d.name for d in layer_path.iterdir() if d.is_dir() and not d.name.startswith('__')]
 
         # Check for suspicious directories
-        if layer_name == 'domain':
-            suspicious = ['controllers', 'routers', 'api', 'database', 'orm']
-            for subdir in subdirs:
-                if subdir.lower() in suspicious:
-                    self.issues.append(
-                        f"Domain layer contains '{subdir}' - this might belong in an outer layer"
-                    )
-
-        elif layer_name == 'application':
-            suspicious = ['models', 'database', 'orm', 'api', 'controllers']
-            for subdir in subdirs:
-                if subdir.lower() in suspicious:
-                    self.issues.append(
-                        f"Application layer contains '{subdir}' - this might belong in another layer"
-                    )
-
-
-def main():
+        if layer_name not in self.SUSPICIOUS_SUBDIRS:
+            return
+
+        suspicious, belongs_in = self.SUSPICIOUS_SUBDIRS[layer_name]
+        for subdir in subdirs:
+            if subdir.lower() in suspicious:
+                self.issues.append(
+                    f"{layer_name.capitalize()} layer contains '{subdir}' - "
+                    f"this might belong in {belongs_in}"
+                )
+
+
+def main() -> None:
     """Main entry point."""
     if len(sys.argv) > 1:
         root_path = Path(sys.argv[1])
@@ -269,4 +348,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    compiled_main('validate_imports', main)()
\ No newline at end of file
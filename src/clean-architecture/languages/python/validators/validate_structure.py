@@ -10,177 +10,263 @@ Checks:
 
 Usage:
     python validate_structure.py [path_to_src]
+
+Per-file results are cached in .validator_cache.sqlite under the source
+directory (add it to the project's .gitignore), and the validators can be
+compiled with mypyc for speed; see _validator_common.py for both.
 """
 
+import abc
 import ast
 import re
 import sys
 import os
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Pattern, Set, Tuple
 
+from _validator_common import ResultCache, compiled_main, map_files, parse, scandir_py
 
-class NamingConventionValidator:
-    """Validates naming conventions."""
+# Statements that open a new scope
+NESTED_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Identifier naming patterns, compiled once
+PASCAL_CASE = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+SNAKE_CASE = re.compile(r'^[a-z_][a-z0-9_]*$')
+UPPER_SNAKE_CASE = re.compile(r'^[A-Z][A-Z0-9_]*$')
+
+# Bump when the cached result format or any validator's checks change
+CACHE_TABLE = 'structure_v2'
+
+
+class _CombinedVisitor(ast.NodeVisitor):
+    """Walk a module once, dispatching nodes to callbacks registered by validators.
+
+    Every check in this module inspects statements (classes, functions,
+    assignments), so only nested statement blocks are descended into;
+    expressions are never visited.
+    """
+
+    # Fields that hold nested statement blocks
+    BLOCK_FIELDS: ClassVar[Tuple[str, ...]] = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._callbacks: Dict[type, List[Callable[[Any, str], None]]] = {}
+        self._deferred: List[Callable[[str], None]] = []
+
+    def register(self, node_type: type, callback: Callable[[Any, str], None]) -> None:
+        """Call callback(node, file_path) for every node of exactly node_type."""
+        self._callbacks.setdefault(node_type, []).append(callback)
+
+    @property
+    def needs_tree(self) -> bool:
+        """Whether any validator registered a callback that needs the AST."""
+        return bool(self._callbacks or self._deferred)
 
-    def __init__(self):
+    def defer(self, callback: Callable[[str], None]) -> None:
+        """Call callback(file_path) once the walk has finished."""
+        self._deferred.append(callback)
+
+    def run(self, tree: ast.AST) -> None:
+        """Walk the tree, then run deferred callbacks."""
+        self.visit(tree)
+        for callback in self._deferred:
+            callback(self.file_path)
+
+    def visit(self, node: ast.AST) -> None:
+        callbacks = self._callbacks.get(type(node))
+        if callbacks:
+            for callback in callbacks:
+                callback(node, self.file_path)
+        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Inlined replacement for ast.iter_child_nodes, limited to statement blocks
+        for field in self.BLOCK_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+
+class _Validator(abc.ABC):
+    """Base for the structure validators: issue storage and reporting.
+
+    Only the first MAX_ISSUES issues are kept; the rest are just counted,
+    since reports print a handful and summarize the remainder.
+    """
+
+    MAX_ISSUES: ClassVar[int] = 50
+
+    def __init__(self) -> None:
         self.issues: List[str] = []
+        self._overflow = 0
 
-    def validate_file(self, file_path: Path) -> None:
-        """Validate naming in a single file."""
-        # Skip test files
-        if 'test' in str(file_path):
-            return
+    @abc.abstractmethod
+    def register(self, visitor: _CombinedVisitor) -> None:
+        """Register this validator's checks with a file's visitor."""
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content, filename=str(file_path))
+    @abc.abstractmethod
+    def report(self) -> bool:
+        """Report issues; return True if there were none."""
+
+    def add_issues(self, issues: List[str]) -> None:
+        """Add issues found in one file, keeping at most MAX_ISSUES."""
+        room = max(self.MAX_ISSUES - len(self.issues), 0)
+        self.issues.extend(issues[:room])
+        self._overflow += max(len(issues) - room, 0)
+
+    def _report(self, title: str, limit: int) -> bool:
+        """Print the first limit issues under title; return True if there were none."""
+        if not self.issues:
+            return True
+
+        print(f"\n⚠️  {title}:")
+        for issue in self.issues[:limit]:
+            print(f"  - {issue}")
+        total = len(self.issues) + self._overflow
+        if total > limit:
+            print(f"  ... and {total - limit} more")
+        return False
+
+
+class NamingConventionValidator(_Validator):
+    """Validates naming conventions."""
 
-            self._check_classes(tree, file_path)
-            self._check_functions(tree, file_path)
-            self._check_constants(tree, file_path)
+    def register(self, visitor: _CombinedVisitor) -> None:
+        """Register naming checks with a file's visitor."""
+        # Skip test files
+        if 'test' in visitor.file_path:
+            return
 
-        except Exception as e:
-            pass  # Silently skip files that can't be parsed
+        visitor.register(ast.ClassDef, self._check_class)
+        visitor.register(ast.FunctionDef, self._check_function)
+        visitor.register(ast.Assign, self._check_constant)
 
-    def _check_classes(self, tree: ast.AST, file_path: Path) -> None:
+    def _check_class(self, node: ast.ClassDef, file_path: str) -> None:
         """Check class naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if not self._is_pascal_case(node.name):
-                    self.issues.append(
-                        f"{file_path}: Class '{node.name}' should use PascalCase"
-                    )
+        if not self._is_pascal_case(node.name):
+            self.issues.append(
+                f"{file_path}: Class '{node.name}' should use PascalCase"
+            )
 
-    def _check_functions(self, tree: ast.AST, file_path: Path) -> None:
+    def _check_function(self, node: ast.FunctionDef, file_path: str) -> None:
         """Check function naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Skip dunder methods
-                if node.name.startswith('__') and node.name.endswith('__'):
-                    continue
+        # Skip dunder methods
+        if node.name.startswith('__') and node.name.endswith('__'):
+            return
 
-                if not self._is_snake_case(node.name):
-                    self.issues.append(
-                        f"{file_path}: Function '{node.name}' should use snake_case"
-                    )
+        if not self._is_snake_case(node.name):
+            self.issues.append(
+                f"{file_path}: Function '{node.name}' should use snake_case"
+            )
 
-    def _check_constants(self, tree: ast.AST, file_path: Path) -> None:
+    def _check_constant(self, node: ast.Assign, file_path: str) -> None:
         """Check constant naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        # If assigned at module level and all caps, it's likely a constant
-                        if target.id.isupper() and '_' in target.id:
-                            if not self._is_upper_snake_case(target.id):
-                                self.issues.append(
-                                    f"{file_path}: Constant '{target.id}' should use UPPER_SNAKE_CASE"
-                                )
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                # If assigned at module level and all caps, it's likely a constant
+                if target.id.isupper() and '_' in target.id:
+                    if not self._is_upper_snake_case(target.id):
+                        self.issues.append(
+                            f"{file_path}: Constant '{target.id}' should use UPPER_SNAKE_CASE"
+                        )
 
     @staticmethod
     def _is_pascal_case(name: str) -> bool:
         """Check if name is in PascalCase."""
-        return re.match(r'^[A-Z][a-zA-Z0-9]*$', name) is not None
+        return PASCAL_CASE.match(name) is not None
 
     @staticmethod
     def _is_snake_case(name: str) -> bool:
         """Check if name is in snake_case."""
-        return re.match(r'^[a-z_][a-z0-9_]*$', name) is not None
+        return SNAKE_CASE.match(name) is not None
 
     @staticmethod
     def _is_upper_snake_case(name: str) -> bool:
         """Check if name is in UPPER_SNAKE_CASE."""
-        return re.match(r'^[A-Z][A-Z0-9_]*$', name) is not None
+        return UPPER_SNAKE_CASE.match(name) is not None
 
     def report(self) -> bool:
         """Report naming convention issues."""
-        if self.issues:
-            print("\n⚠️  Naming Convention Issues:")
-            for issue in self.issues[:10]:  # Limit to first 10 issues
-                print(f"  - {issue}")
-            if len(self.issues) > 10:
-                print(f"  ... and {len(self.issues) - 10} more")
-            return False
-        return True
+        return self._report("Naming Convention Issues", 10)
 
 
-class EncapsulationValidator:
+class EncapsulationValidator(_Validator):
     """Validates encapsulation patterns."""
 
-    def __init__(self):
-        self.issues: List[str] = []
+    def register(self, visitor: _CombinedVisitor) -> None:
+        """Register encapsulation checks with a file's visitor."""
+        file_path = visitor.file_path
 
-    def validate_file(self, file_path: Path) -> None:
-        """Validate encapsulation in a single file."""
         # Only check domain and application layers
-        if 'domain' not in str(file_path) and 'application' not in str(file_path):
+        if 'domain' not in file_path and 'application' not in file_path:
             return
 
         # Skip test files
-        if 'test' in str(file_path):
+        if 'test' in file_path:
             return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content, filename=str(file_path))
-
-            self._check_public_attributes(tree, file_path)
-            self._check_property_usage(tree, file_path)
-
-        except Exception:
-            pass  # Silently skip files that can't be parsed
+        visitor.register(ast.ClassDef, self._check_public_attributes)
+        visitor.register(ast.ClassDef, self._check_property_usage)
 
-    def _check_public_attributes(self, tree: ast.AST, file_path: Path) -> None:
+    def _check_public_attributes(self, node: ast.ClassDef, file_path: str) -> None:
         """Check for public attributes that should be private."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Skip Protocol classes and dataclasses
-                if self._is_protocol_or_dataclass(node):
-                    continue
-
-                for item in node.body:
-                    if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                        attr_name = item.target.id
-                        # Check if it's a public mutable attribute
-                        if not attr_name.startswith('_') and attr_name != attr_name.upper():
-                            self.issues.append(
-                                f"{file_path}: Class '{node.name}' has public attribute '{attr_name}'. "
-                                "Consider making it private with underscore prefix."
-                            )
-
-    def _check_property_usage(self, tree: ast.AST, file_path: Path) -> None:
-        """Check for proper use of properties for controlled access."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                has_private_attrs = False
-                has_properties = False
-
-                for item in node.body:
-                    # Check for private attributes
-                    if isinstance(item, ast.FunctionDef) and item.name == '__init__':
-                        for stmt in ast.walk(item):
-                            if isinstance(stmt, ast.Assign):
-                                for target in stmt.targets:
-                                    if isinstance(target, ast.Attribute):
-                                        if target.attr.startswith('_'):
-                                            has_private_attrs = True
-
-                    # Check for properties
-                    if isinstance(item, ast.FunctionDef):
-                        for decorator in item.decorator_list:
-                            if isinstance(decorator, ast.Name) and decorator.id == 'property':
-                                has_properties = True
-
-                # Suggest using properties for classes with private attributes
-                if has_private_attrs and not has_properties and 'entity' in file_path.lower():
+        # Skip Protocol classes and dataclasses
+        if self._is_protocol_or_dataclass(node):
+            return
+
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                attr_name = item.target.id
+                # Check if it's a public mutable attribute
+                if not attr_name.startswith('_') and attr_name != attr_name.upper():
                     self.issues.append(
-                        f"{file_path}: Class '{node.name}' has private attributes. "
-                        "Consider using @property for controlled access."
+                        f"{file_path}: Class '{node.name}' has public attribute '{attr_name}'. "
+                        "Consider making it private with underscore prefix."
                     )
 
+    def _check_property_usage(self, node: ast.ClassDef, file_path: str) -> None:
+        """Check for proper use of properties for controlled access."""
+        has_private_attrs = False
+        has_properties = False
+
+        for item in node.body:
+            # Check for private attributes
+            if isinstance(item, ast.FunctionDef) and item.name == '__init__':
+                if not has_private_attrs:
+                    has_private_attrs = self._assigns_private_attribute(item)
+
+            # Check for properties
+            if isinstance(item, ast.FunctionDef):
+                for decorator in item.decorator_list:
+                    if isinstance(decorator, ast.Name) and decorator.id == 'property':
+                        has_properties = True
+
+        # Suggest using properties for classes with private attributes
+        if has_private_attrs and not has_properties and 'entity' in file_path.lower():
+            self.issues.append(
+                f"{file_path}: Class '{node.name}' has private attributes. "
+                "Consider using @property for controlled access."
+            )
+
+    @staticmethod
+    def _assigns_private_attribute(init: ast.FunctionDef) -> bool:
+        """Check if __init__ assigns a private attribute (self._x = ...).
+
+        Only statement blocks are searched; nested functions and classes are
+        skipped since their bodies don't run as part of __init__.
+        """
+        stack = list(init.body)
+        while stack:
+            stmt = stack.pop()
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if isinstance(target, ast.Attribute) and target.attr.startswith('_'):
+                        return True
+            elif not isinstance(stmt, NESTED_SCOPES):
+                for field in _CombinedVisitor.BLOCK_FIELDS:
+                    stack.extend(getattr(stmt, field, ()))
+        return False
+
     @staticmethod
     def _is_protocol_or_dataclass(node: ast.ClassDef) -> bool:
         """Check if class is a Protocol or dataclass."""
@@ -201,20 +287,13 @@ class EncapsulationValidator:
 
     def report(self) -> bool:
         """Report encapsulation issues."""
-        if self.issues:
-            print("\n⚠️  Encapsulation Issues:")
-            for issue in self.issues[:5]:  # Limit to first 5 issues
-                print(f"  - {issue}")
-            if len(self.issues) > 5:
-                print(f"  ... and {len(self.issues) - 5} more")
-            return False
-        return True
+        return self._report("Encapsulation Issues", 5)
 
 
-class LayerContentValidator:
+class LayerContentValidator(_Validator):
     """Validates that files are in appropriate layers."""
 
-    PATTERNS = {
+    PATTERNS: ClassVar[Dict[str, Dict[str, List[str]]]] = {
         'domain': {
             'allowed': [
                 r'entity', r'entities', r'value_object', r'aggregate',
@@ -251,81 +330,89 @@ class LayerContentValidator:
         }
     }
 
-    def __init__(self):
-        self.issues: List[str] = []
+    # Each layer's forbidden patterns combined into one alternation
+    FORBIDDEN: ClassVar[Dict[str, Pattern[str]]] = {
+        layer: re.compile('|'.join(patterns['forbidden']))
+        for layer, patterns in PATTERNS.items()
+        if patterns['forbidden']
+    }
+
+    # Directory names recognised as layers, mapped to their PATTERNS key
+    LAYER_DIRS: ClassVar[Dict[str, str]] = {
+        'domain': 'domain',
+        'application': 'application',
+        'infrastructure': 'infrastructure',
+        'frameworks': 'frameworks',
+        'framework': 'frameworks',
+    }
+
+    def register(self, visitor: _CombinedVisitor) -> None:
+        """Check if file is in the appropriate layer (path only, no AST needed)."""
+        file_path = visitor.file_path
 
-    def validate_file(self, file_path: Path) -> None:
-        """Check if file is in the appropriate layer."""
         # Determine which layer the file is in
         layer = self._get_layer(file_path)
         if not layer:
             return
 
-        file_name = file_path.stem.lower()
-        patterns = self.PATTERNS.get(layer, {})
+        forbidden = self.FORBIDDEN.get(layer)
+        if forbidden is None:
+            return
+
+        base_name = os.path.basename(file_path)
+        file_name = os.path.splitext(base_name)[0].lower()
 
-        # Check forbidden patterns
-        for pattern in patterns.get('forbidden', []):
+        # One search rejects clean files; only matches need the per-pattern pass
+        if not forbidden.search(file_name):
+            return
+
+        # Report each forbidden pattern found
+        for pattern in self.PATTERNS[layer]['forbidden']:
             if re.search(pattern, file_name):
                 self.issues.append(
-                    f"{file_path}: File '{file_path.name}' contains '{pattern}' "
+                    f"{file_path}: File '{base_name}' contains '{pattern}' "
                     f"which shouldn't be in {layer} layer"
                 )
 
-    @staticmethod
-    def _get_layer(file_path: Path) -> Optional[str]:
+    @classmethod
+    def _get_layer(cls, file_path: str) -> Optional[str]:
         """Determine which layer a file belongs to."""
-        parts = file_path.parts
-        for part in parts:
-            if part.lower() in ['domain', 'application', 'infrastructure', 'frameworks', 'framework']:
-                return part.lower() if part.lower() != 'framework' else 'frameworks'
+        layer_dirs = cls.LAYER_DIRS
+        for part in file_path.split(os.sep):
+            # Layer keys are lowercase, so only lowercase parts that aren't already
+            layer = layer_dirs.get(part)
+            if layer is None and not part.islower():
+                layer = layer_dirs.get(part.lower())
+            if layer is not None:
+                return layer
         return None
 
     def report(self) -> bool:
         """Report layer content issues."""
-        if self.issues:
-            print("\n⚠️  Layer Content Issues:")
-            for issue in self.issues[:5]:
-                print(f"  - {issue}")
-            if len(self.issues) > 5:
-                print(f"  ... and {len(self.issues) - 5} more")
-            return False
-        return True
+        return self._report("Layer Content Issues", 5)
 
 
-class UseCaseStructureValidator:
+class UseCaseStructureValidator(_Validator):
     """Validates use case structure (Request, Response, UseCase in same file)."""
 
-    def __init__(self):
-        self.issues: List[str] = []
+    def register(self, visitor: _CombinedVisitor) -> None:
+        """Collect the file's class names, then check them once the walk ends."""
+        file_path = visitor.file_path
 
-    def validate_file(self, file_path: Path) -> None:
-        """Validate use case file structure."""
         # Only check application layer use case files
-        if 'application' not in str(file_path) or 'use_case' not in file_path.stem.lower():
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        if 'application' not in file_path or 'use_case' not in stem.lower():
             return
 
         # Skip test files
-        if 'test' in str(file_path):
+        if 'test' in file_path:
             return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content, filename=str(file_path))
-
-            classes = self._get_class_names(tree)
-            self._check_use_case_pattern(classes, file_path)
+        classes: Set[str] = set()
+        visitor.register(ast.ClassDef, lambda node, file_path: classes.add(node.name))
+        visitor.defer(lambda file_path: self._check_use_case_pattern(classes, file_path))
 
-        except Exception:
-            pass
-
-    @staticmethod
-    def _get_class_names(tree: ast.AST) -> Set[str]:
-        """Get all class names in the file."""
-        return {node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)}
-
-    def _check_use_case_pattern(self, classes: Set[str], file_path: Path) -> None:
+    def _check_use_case_pattern(self, classes: Set[str], file_path: str) -> None:
         """Check if use case follows the pattern."""
         use_case_classes = [c for c in classes if 'UseCase' in c]
 
@@ -348,17 +435,66 @@ class UseCaseStructureValidator:
 
     def report(self) -> bool:
         """Report use case structure issues."""
-        if self.issues:
-            print("\n⚠️  Use Case Structure Issues:")
-            for issue in self.issues[:5]:
-                print(f"  - {issue}")
-            if len(self.issues) > 5:
-                print(f"  ... and {len(self.issues) - 5} more")
-            return False
-        return True
+        return self._report("Use Case Structure Issues", 5)
+
+
+def _make_validators() -> List[Tuple[str, _Validator]]:
+    """Create a fresh set of validators, in reporting order."""
+    return [
+        ("Naming Conventions", NamingConventionValidator()),
+        ("Encapsulation", EncapsulationValidator()),
+        ("Layer Content", LayerContentValidator()),
+        ("Use Case Structure", UseCaseStructureValidator())
+    ]
+
+
+def _validate_one(file_path: str, cached_sha: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Read, parse and check one file with every validator; runs in worker processes.
+
+    Returns None if the file can't be read. Otherwise the result holds the
+    content hash ('sha'), the file's issues per validator in
+    _make_validators() order ('issues'), and whether they may be cached
+    ('cacheable'). When the hash matches cached_sha the file is not parsed
+    and 'issues' is None; when no check needs the file's content it is not
+    read at all and 'sha' is None.
+    """
+    validators = [validator for _, validator in _make_validators()]
+    visitor = _CombinedVisitor(file_path)
+    for validator in validators:
+        validator.register(visitor)
+
+    # Path-only checks need neither the file's content nor its AST
+    if not visitor.needs_tree:
+        return {
+            'sha': None,
+            'issues': [validator.issues for validator in validators],
+            'cacheable': False,
+        }
+
+    try:
+        with open(file_path, 'rb') as f:
+            source = f.read()
+    except OSError:
+        return None
 
+    sha = ResultCache.digest(source)
+    if sha == cached_sha:
+        return {'sha': sha, 'issues': None, 'cacheable': True}
 
-def main():
+    try:
+        visitor.run(parse(source, file_path))
+        cacheable = True
+    except Exception:
+        cacheable = False  # Silently skip files that can't be parsed
+
+    return {
+        'sha': sha,
+        'issues': [validator.issues for validator in validators],
+        'cacheable': cacheable,
+    }
+
+
+def main() -> None:
     """Main entry point."""
     if len(sys.argv) > 1:
         root_path = Path(sys.argv[1])
@@ -386,22 +522,38 @@ def main():
     all_valid = True
 
     # Find all Python files
-    py_files = list(root_path.rglob("*.py"))
+    py_files = list(scandir_py(root_path))
     print(f"Found {len(py_files)} Python files to validate")
 
     # Run validators
-    validators = [
-        ("Naming Conventions", NamingConventionValidator()),
-        ("Encapsulation", EncapsulationValidator()),
-        ("Layer Content", LayerContentValidator()),
-        ("Use Case Structure", UseCaseStructureValidator())
-    ]
+    validators = _make_validators()
+
+    # Each file is read and parsed once, with one walk shared by all validators.
+    # Files are checked in parallel, and unchanged files reuse cached issues.
+    cache = ResultCache(root_path, CACHE_TABLE)
+    try:
+        cached_shas = cache.shas()
+        # Files not seen this run were deleted or moved (or are now skipped)
+        cache.prune(cached_shas.keys() - set(py_files))
+        shas = [cached_shas.get(py_file) for py_file in py_files]
+        for py_file, result in zip(py_files, map_files(_validate_one, py_files, shas)):
+            if result is not None and result['issues'] is None:
+                # Unchanged since it was cached; fall back to checking if the row is gone
+                cached = cache.get(py_file, result['sha'])
+                result = _validate_one(py_file) if cached is None else dict(result, issues=cached)
+            if result is None:
+                continue
+
+            if result['cacheable']:
+                cache.put(py_file, result['sha'], result['issues'])
+            # Per-file results stay complete for the cache; only the totals are capped
+            for (_, validator), issues in zip(validators, result['issues']):
+                validator.add_issues(issues)
+    finally:
+        cache.close()
 
     for validator_name, validator in validators:
         print(f"\nValidating {validator_name}...")
-        for py_file in py_files:
-            validator.validate_file(py_file)
-
         if not validator.report():
             all_valid = False
 
@@ -415,4 +567,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    compiled_main('validate_structure', main)()
\ No newline at end of file
@@ -16,58 +16,61 @@ import os
 from pathlib import Path
 
 
+# Map common code fence language variations to standard names
+LANG_MAP = {
+    'ts': 'typescript',
+    'js': 'javascript',
+    'py': 'python',
+    'cs': 'csharp',
+    'sh': 'bash',
+    'shell': 'bash',
+    'yml': 'yaml',
+}
+
+# Internal links ([text](path.md) or [text](path.md#anchor)) and code fence lines,
+# matched together so each file is rewritten in a single pass
+MARKDOWN_PATTERN = re.compile(
+    r'(?P<link>\[(?P<text>[^\]]+)\]\([^)]+\.md(?:#[^)]*)?\))'
+    r'|(?P<fence>^```(?P<lang>\w*)$)',
+    re.MULTILINE,
+)
+
+
 def strip_frontmatter(content: str) -> str:
     """Remove YAML frontmatter from markdown."""
     if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            return parts[2].lstrip('\n')
+        end = content.find('---', 3)
+        if end != -1:
+            return content[end + 3:].lstrip('\n')
     return content
 
 
-def convert_md_links(content: str) -> str:
+def _rewrite_match(match: re.Match) -> str:
+    """Rewrite one internal link or code fence matched by MARKDOWN_PATTERN."""
+    if match.lastgroup == 'link':
+        # Just keep the link text in italics
+        return f'*{match.group("text")}*'
+
+    lang = match.group('lang')
+    if lang:
+        # Only normalize if there's a language identifier
+        lang = lang.lower()
+        return f'```{LANG_MAP.get(lang, lang)}'
+    # Leave empty fences as-is (they're closing fences)
+    return '```'
+
+
+def rewrite_links_and_fences(content: str) -> str:
     """
-    Convert markdown file links to readable text.
+    Convert markdown file links to readable text and normalize code fence
+    language identifiers (map aliases to standard names).
 
     Examples:
     - [Domain Layer](domain.md) -> *Domain Layer*
     - [see patterns](references/layer-patterns.md#domain) -> *see patterns*
+    - ```py -> ```python
     """
-    # Pattern: [text](path.md) or [text](path.md#anchor)
-    link_pattern = r'\[([^\]]+)\]\(([^)]+\.md(?:#[^)]*)?)\)'
-
-    def replace_link(match):
-        text = match.group(1)
-        # Just keep the link text in italics
-        return f'*{text}*'
-
-    return re.sub(link_pattern, replace_link, content)
-
-
-def normalize_code_fences(content: str) -> str:
-    """Normalize code fence language identifiers (map aliases to standard names)."""
-    # Map common variations to standard names
-    lang_map = {
-        'ts': 'typescript',
-        'js': 'javascript',
-        'py': 'python',
-        'cs': 'csharp',
-        'sh': 'bash',
-        'shell': 'bash',
-        'yml': 'yaml',
-    }
-
-    def replace_fence(match):
-        lang = match.group(1) or ''
-        lang = lang.strip()
-        if lang:
-            # Only normalize if there's a language identifier
-            lang = lang_map.get(lang.lower(), lang.lower())
-            return f'```{lang}'
-        # Leave empty fences as-is (they're closing fences)
-        return '```'
-
-    return re.sub(r'^```(\w*)$', replace_fence, content, flags=re.MULTILINE)
+    return MARKDOWN_PATTERN.sub(_rewrite_match, content)
 
 
 def process_file(filepath: Path) -> str:
@@ -77,13 +80,8 @@ def process_file(filepath: Path) -> str:
     # Strip frontmatter if present
     content = strip_frontmatter(content)
 
-    # Convert internal links
-    content = convert_md_links(content)
-
-    # Normalize code fences
-    content = normalize_code_fences(content)
-
-    return content
+    # Convert internal links and normalize code fences
+    return rewrite_links_and_fences(content)
 
 
 def add_part_break(title: str) -> str:
@@ -137,28 +135,29 @@ def main():
         ]),
     ]
 
-    output_content = []
     files_processed = 0
     files_missing = 0
 
-    for part_title, files in structure:
-        output_content.append(add_part_break(part_title))
-
-        for file_path in files:
-            full_path = input_dir / file_path
-            if full_path.exists():
-                print(f"  Processing: {file_path}")
-                content = process_file(full_path)
-                output_content.append(content)
-                output_content.append('\n\n')  # Separation between files
-                files_processed += 1
-            else:
-                print(f"  Warning: File not found: {full_path}", file=sys.stderr)
-                files_missing += 1
-
-    # Write combined content
+    # Stream each chunk straight to the output file instead of joining them in
+    # memory; chunks are newline-separated, as the previous '\n'.join() did
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text('\n'.join(output_content), encoding='utf-8')
+    with open(output_file, 'w', encoding='utf-8') as out:
+        for part_index, (part_title, files) in enumerate(structure):
+            if part_index:
+                out.write('\n')
+            out.write(add_part_break(part_title))
+
+            for file_path in files:
+                full_path = input_dir / file_path
+                if full_path.exists():
+                    print(f"  Processing: {file_path}")
+                    out.write('\n')
+                    out.write(process_file(full_path))
+                    out.write('\n\n\n')  # Separation between files
+                    files_processed += 1
+                else:
+                    print(f"  Warning: File not found: {full_path}", file=sys.stderr)
+                    files_missing += 1
 
     print(f"\nCombined {files_processed} files into {output_file}")
     if files_missing > 0:
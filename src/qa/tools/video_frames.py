@@ -1,11 +1,438 @@
 #!/usr/bin/env python3
-"""Extract frames from a video at configurable intervals for QA inspection."""
+"""Extract frames from a video at configurable intervals for QA inspection.
+
+Run as a script to save frames as image files. To process frames in memory
+instead, import iter_frames, which yields each sampled frame as an array.
+"""
 
 import argparse
+import functools
+import itertools
+import math
 import os
+import queue
 import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import av
+import numpy as np
+from av.codec.hwaccel import HWAccel, hwdevices_available
+from av.video.reformatter import VideoReformatter
+
+try:
+    from PIL import Image
+except ImportError:  # optional: only needed for --backend pillow
+    Image = None
+
+try:
+    import pyvips
+except ImportError:  # optional: faster JPEG/WebP encoding via libvips
+    pyvips = None
+
+try:
+    import cv2
+except ImportError:  # optional: only needed for --backend cv2
+    cv2 = None
+
+__all__ = ["iter_frames"]
+
+# Encoder settings per output format, one table per backend. WebP and JPEG
+# encode far faster than PNG and give smaller files; PNG stays lossless but
+# uses a light zlib level.
+
+# FFmpeg image codec, its input pixel format and options. webp and jpg take
+# the decoder's YUV directly, skipping the round trip through RGB; mjpeg's
+# fixed quantizer 2 is on par with JPEG quality 90.
+AV_ENCODERS = {
+    "webp": ("libwebp", "yuv420p", {"quality": "85"}),
+    "jpg": ("mjpeg", "yuvj420p", {"qmin": "2", "qmax": "2"}),
+    "png": ("png", "rgb24", {"compression_level": "1"}),
+}
+
+PILLOW_SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 85},
+    "jpg": {"format": "JPEG", "quality": 90, "optimize": True},
+    "png": {"format": "PNG", "compress_level": 1},
+}
+
+VIPS_SAVE_OPTIONS = {
+    "webp": {"Q": 85},
+    "jpg": {"Q": 90, "optimize_coding": True},
+    "png": {"compression": 1},
+}
+
+IMWRITE_PARAMS = {
+    "webp": [cv2.IMWRITE_WEBP_QUALITY, 85],
+    "jpg": [cv2.IMWRITE_JPEG_QUALITY, 90, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+    "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],
+} if cv2 is not None else {}
+
+# Image encoding backends, mapped to their module (None if not installed)
+BACKENDS = {"av": av, "pillow": Image, "vips": pyvips, "cv2": cv2}
+
+# Slack when matching sample times to frame times, far below any frame duration
+TIME_TOLERANCE = 1e-6
+
+# First step back, in seconds, when a seek lands past its target
+SEEK_BACKOFF = 1.0
+
+# Write buffer for PPM files, so each frame goes to disk in a few large writes
+PPM_BUFFER_SIZE = 1 << 20
+
+# Saved paths printed between stdout flushes
+PRINT_BATCH_SIZE = 32
+
+# Decoded frames waiting to be written; bounds memory to a few frames
+WRITE_QUEUE_SIZE = 4
+# How often a put on the full write queue rechecks that the writer is still running
+WRITE_QUEUE_TIMEOUT = 0.5
+
+
+def _stream_start(container: av.container.InputContainer, stream: av.VideoStream) -> float:
+    """Return the time in seconds at which stream starts, e.g. 1.4s for many MPEG-TS files."""
+    if stream.start_time is not None:
+        return float(stream.start_time * stream.time_base)
+    if container.start_time is not None:
+        return container.start_time / av.time_base
+    return 0.0
+
+
+def _seek(
+    container: av.container.InputContainer, stream: av.VideoStream, start: float, timestamp: float
+) -> Iterator[av.VideoFrame]:
+    """Seek to a keyframe at or before timestamp (seconds from start); return the frames from there.
+
+    Some demuxers, MPEG-TS in particular, can land past the requested time, or
+    on packets that decode to nothing before the next keyframe. The first frame
+    is checked, and the seek retried further back, doubling the step each time,
+    until it lands in time or at the start of the stream.
+    """
+    # Seconds to stream pts as a float multiply, not a Fraction division per seek
+    pts_per_second = 1.0 / float(stream.time_base)
+    seek_time = timestamp
+    step = SEEK_BACKOFF
+    while True:
+        container.seek(
+            int((start + max(seek_time, 0.0)) * pts_per_second),
+            stream=stream, backward=True, any_frame=False,
+        )
+        frames = (frame for frame in container.decode(stream) if frame.time is not None)
+        first = next(frames, None)
+        if seek_time <= 0 and first is None:
+            return iter(())
+        if seek_time <= 0 or (first is not None and first.time - start <= timestamp + TIME_TOLERANCE):
+            return itertools.chain([first], frames)
+        seek_time -= step
+        step *= 2
+
+
+def _sample_frames(
+    container: av.container.InputContainer,
+    stream: av.VideoStream,
+    timestamps: list[float],
+) -> Iterator[tuple[float, av.VideoFrame]]:
+    """Yield (timestamp, frame) for each of the ascending timestamps, decoding forward.
+
+    Timestamps count from the start of the stream, which need not be at 0.
+    Nearby targets are reached by decoding on from the current position. A seek
+    only happens when the next target is further ahead than the widest keyframe
+    spacing seen so far; a shorter jump could land on a keyframe already passed.
+    """
+    start = _stream_start(container, stream)
+    if timestamps and timestamps[0] > 0:
+        frames = _seek(container, stream, start, timestamps[0])
+    else:
+        frames = (frame for frame in container.decode(stream) if frame.time is not None)
+    frame = None
+    position = -math.inf
+    last_keyframe = None
+    keyframe_gap = None
+    for timestamp in timestamps:
+        # Allow for float rounding, e.g. 3 * 0.1 landing just past a frame at 0.3s
+        target = timestamp - TIME_TOLERANCE
+        if position < target:
+            if keyframe_gap is not None and target - position > keyframe_gap:
+                frames = _seek(container, stream, start, timestamp)
+                last_keyframe = None
+            for frame in frames:
+                position = frame.time - start
+                if frame.key_frame:
+                    if last_keyframe is not None:
+                        keyframe_gap = max(keyframe_gap or 0.0, position - last_keyframe)
+                    last_keyframe = position
+                if position >= target:
+                    break
+            else:
+                return
+
+        yield timestamp, frame
+
+
+def _write_ppm(filepath: str, rgb) -> None:
+    """Write an RGB frame as a binary PPM: a short header, then the raw pixels."""
+    height, width = rgb.shape[:2]
+    with open(filepath, "wb", buffering=PPM_BUFFER_SIZE) as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        # Rows padded for alignment (e.g. 322 or 1366 wide) leave the array
+        # strided; copy those, while contiguous frames are written as they are
+        f.write(np.ascontiguousarray(rgb))
+
+
+def _encoder(image_format: str, backend: str) -> str:
+    """Name the encoder that writes image_format: "raw" for PPM, else the backend."""
+    return "raw" if image_format == "ppm" else backend
+
+
+def _pixel_format(encoder: str, image_format: str) -> str:
+    """Name the pixel format encoder takes its frames in."""
+    if encoder == "av":
+        return AV_ENCODERS[image_format][1]
+    return "bgr24" if encoder == "cv2" else "rgb24"
+
+
+def _encode_with_av(frame: av.VideoFrame, image_format: str) -> bytes:
+    """Encode one frame as a complete image file with an FFmpeg image codec."""
+    codec, pixel_format, options = AV_ENCODERS[image_format]
+    context = av.CodecContext.create(codec, "w")
+    context.width = frame.width
+    context.height = frame.height
+    context.pix_fmt = pixel_format
+    context.options = options
+    return b"".join(bytes(packet) for packet in [*context.encode(frame), *context.encode(None)])
+
+
+def _write_frames(
+    write_q: queue.Queue,
+    image_format: str,
+    backend: str,
+    on_written: Callable[[str], None],
+    errors: list[BaseException],
+) -> None:
+    """Write (filepath, frame) items from write_q until a None sentinel arrives.
+
+    on_written is called with each filepath once its file is saved. A failure
+    is appended to errors, and the remaining items are discarded until the
+    sentinel, so the producer never blocks on a full queue.
+    """
+    try:
+        encoder = _encoder(image_format, backend)
+        extension = f".{image_format}"
+        while (item := write_q.get()) is not None:
+            filepath, frame = item
+            if encoder == "raw":
+                _write_ppm(filepath, frame)
+            elif encoder == "vips":
+                height, width = frame.shape[:2]
+                # new_from_memory needs a contiguous buffer; padded rows make a strided view
+                buffer = np.ascontiguousarray(frame)
+                image = pyvips.Image.new_from_memory(buffer, width, height, 3, "uchar")
+                image.write_to_file(filepath, **VIPS_SAVE_OPTIONS[image_format])
+            elif encoder == "av":
+                Path(filepath).write_bytes(_encode_with_av(frame, image_format))
+            elif encoder == "pillow":
+                Image.fromarray(frame).save(filepath, **PILLOW_SAVE_OPTIONS[image_format])
+            else:
+                # Encode in memory and write the file in one go, rather than
+                # through imwrite's small libc writes
+                _, encoded = cv2.imencode(extension, frame, IMWRITE_PARAMS[image_format])
+                Path(filepath).write_bytes(encoded)
+            on_written(filepath)
+    except BaseException as error:
+        errors.append(error)
+        while write_q.get() is not None:
+            pass
+
+
+def _put_for_writer(write_q: queue.Queue, item, writer: threading.Thread) -> bool:
+    """Put item on write_q; return False, instead of blocking, once writer has exited."""
+    while writer.is_alive():
+        try:
+            write_q.put(item, timeout=WRITE_QUEUE_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _frame_path(prefix: str, timestamp: float, image_format: str) -> str:
+    """Name the file for the sample at timestamp; samples within a second can share one."""
+    return f"{prefix}{timestamp:04.0f}s.{image_format}"
+
 
-import cv2
+def _print_batched(batch_size: int) -> Callable[[str], None]:
+    """Return a callback that prints paths, flushing stdout every batch_size paths."""
+    printed = 0
+
+    def print_path(filepath: str) -> None:
+        nonlocal printed
+        print(filepath)
+        printed += 1
+        if printed % batch_size == 0:
+            sys.stdout.flush()
+
+    return print_path
+
+
+def _configure_cv2(threads: int) -> None:
+    """Enable OpenCV's optimized code paths and size its thread pool."""
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(threads)
+
+
+def _open_video(
+    video_path: str, hwaccel: str | None, threads: int = 0
+) -> av.container.InputContainer:
+    """Open video_path for decoding, on the hwaccel device type if given.
+
+    threads caps the decoder's threads; 0 lets FFmpeg pick one per core.
+    """
+    # Hardware-decoded frames are copied back to system memory for encoding
+    container = av.open(video_path, hwaccel=HWAccel(device_type=hwaccel) if hwaccel else None)
+    if container.streams.video:
+        # Slice threading decodes each frame across cores without the extra
+        # latency frame threading adds, which matters when seeking per sample
+        container.streams.video[0].thread_type = "SLICE"
+        container.streams.video[0].thread_count = threads
+    return container
+
+
+def _video_duration(container: av.container.InputContainer) -> float:
+    """Return the first video stream's duration in seconds, or 0.0 if unknown."""
+    stream = container.streams.video[0]
+    # WebM streams often carry no duration of their own; fall back to the container's
+    if stream.duration is not None:
+        return float(stream.duration * stream.time_base)
+    if container.duration is not None:
+        return container.duration / av.time_base
+    return 0.0
+
+
+def iter_frames(
+    video_path: str,
+    interval: float = 2.0,
+    pixel_format: str = "rgb24",
+    hwaccel: str | None = None,
+) -> Iterator[tuple[float, np.ndarray]]:
+    """Yield (timestamp, frame) every interval seconds through the video.
+
+    Frames are (height, width, channels) arrays in pixel_format, e.g. "bgr24"
+    for OpenCV. Frames are decoded only as the caller asks for them, so they
+    can be analysed or discarded without a round trip through image files.
+
+    Raises av.FFmpegError if the video can't be opened, and ValueError if it
+    has no video stream or its duration is unknown.
+    """
+    container = _open_video(video_path, hwaccel)
+    try:
+        if not container.streams.video:
+            raise ValueError(f"no video stream in '{video_path}'")
+        duration = _video_duration(container)
+        if duration <= 0:
+            raise ValueError(f"could not read the duration of '{video_path}'")
+
+        reformatter = VideoReformatter()
+        timestamps = np.arange(0.0, duration, interval).tolist()
+        for timestamp, frame in _sample_frames(container, container.streams.video[0], timestamps):
+            yield timestamp, reformatter.reformat(frame, format=pixel_format).to_ndarray()
+    finally:
+        container.close()
+
+
+def _extract_range(
+    video_path: str,
+    hwaccel: str | None,
+    prefix: str,
+    image_format: str,
+    backend: str,
+    timestamps: list[float],
+    on_written: Callable[[str], None],
+    decode_threads: int = 0,
+) -> int:
+    """Save the frames at timestamps as prefix-named files; return how many were saved."""
+    container = _open_video(video_path, hwaccel, decode_threads)
+    stream = container.streams.video[0]
+
+    # Encoding runs on a writer thread (the encoders release the GIL while working),
+    # so it overlaps with decoding the next sample here
+    write_q: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    errors: list[BaseException] = []
+    extracted = 0
+
+    def count_written(filepath: str) -> None:
+        nonlocal extracted
+        extracted += 1
+        on_written(filepath)
+
+    writer = threading.Thread(
+        target=_write_frames, args=(write_q, image_format, backend, count_written, errors)
+    )
+    writer.start()
+
+    encoder = _encoder(image_format, backend)
+    pixel_format = _pixel_format(encoder, image_format)
+    # One reformatter for the whole run keeps its scaler context between frames
+    reformatter = VideoReformatter()
+    try:
+        for timestamp, frame in _sample_frames(container, stream, timestamps):
+            filepath = _frame_path(prefix, timestamp, image_format)
+            # Frames already in the encoder's format pass through unconverted
+            converted = reformatter.reformat(frame, format=pixel_format)
+            # PyAV encodes the frame itself; the others take an array, which
+            # views the converted frame's pixels without a further copy
+            item = (filepath, converted if encoder == "av" else converted.to_ndarray())
+            if errors or not _put_for_writer(write_q, item, writer):
+                # A write failed; stop decoding and report it below
+                break
+    finally:
+        container.close()
+        # Let the writer drain the queue and exit, even if decoding failed
+        _put_for_writer(write_q, None, writer)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return extracted
+
+
+def _slice_samples(
+    timestamps: list[float], workers: int, frame_path: Callable[[float], str]
+) -> list[list[float]]:
+    """Split timestamps into at most workers contiguous, near-equal slices.
+
+    Sub-second intervals give several samples the same file name, and the last
+    one written wins. Each such run of samples stays in one slice, in order, so
+    the file holds the same sample as in a serial run.
+    """
+    groups = [list(group) for _, group in itertools.groupby(timestamps, key=frame_path)]
+    if not groups:
+        return []
+    return [
+        [timestamp for index in chunk for timestamp in groups[index]]
+        for chunk in np.array_split(np.arange(len(groups)), min(workers, len(groups)))
+    ]
+
+
+def _extract_range_paths(
+    video_path: str,
+    hwaccel: str | None,
+    prefix: str,
+    image_format: str,
+    backend: str,
+    timestamps: list[float],
+) -> list[str]:
+    """Worker-process entry point: save the frames at timestamps and return their paths."""
+    # The workers already occupy the cores; more decoder or OpenCV threads
+    # would oversubscribe them
+    if backend == "cv2":
+        _configure_cv2(1)
+    written: list[str] = []
+    _extract_range(
+        video_path, hwaccel, prefix, image_format, backend, timestamps, written.append,
+        decode_threads=1,
+    )
+    return written
 
 
 def main() -> None:
@@ -26,44 +453,98 @@ def main() -> None:
     )
     parser.add_argument(
         "--format",
-        choices=["png", "jpg", "webp"],
-        default="png",
-        help="Image format for saved frames (default: png)",
+        choices=["webp", "jpg", "png", "ppm"],
+        default="webp",
+        help=(
+            "Image format for saved frames (default: webp). webp (quality 85) "
+            "and jpg (quality 90) are fast and small; png is lossless but "
+            "slower to encode and larger; ppm is raw and uncompressed, the "
+            "fastest to write but by far the largest"
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default="vips" if pyvips is not None else "av",
+        help=(
+            "Image encoder for webp/jpg/png (default: vips when pyvips is "
+            "installed, else av, which encodes webp and jpg straight from the "
+            "decoded YUV). vips, pillow and cv2 need their extras: "
+            "uv sync --extra vips / --extra pillow / --extra cv2"
+        ),
+    )
+    parser.add_argument(
+        "--hwaccel",
+        choices=hwdevices_available(),
+        help=(
+            "Decode on a hardware device, e.g. cuda for NVDEC on NVIDIA GPUs "
+            "(default: software decoding). Streams the device can't handle "
+            "fall back to software"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Processes extracting in parallel, each decoding its own slice of "
+            "the video (default: number of CPUs)"
+        ),
     )
     args = parser.parse_args()
+    if BACKENDS[args.backend] is None:
+        parser.error(f"--backend {args.backend} is not installed; run: uv sync --extra {args.backend}")
 
-    cap = cv2.VideoCapture(args.video_path)
-    if not cap.isOpened():
-        print(f"Error: could not open video '{args.video_path}'", file=sys.stderr)
+    try:
+        container = _open_video(args.video_path, args.hwaccel)
+    except av.FFmpegError:
+        using = f" with {args.hwaccel} decoding" if args.hwaccel else ""
+        print(f"Error: could not open video '{args.video_path}'{using}", file=sys.stderr)
+        sys.exit(1)
+    if not container.streams.video:
+        print(f"Error: no video stream in '{args.video_path}'", file=sys.stderr)
+        container.close()
         sys.exit(1)
 
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    if fps <= 0 or total_frames <= 0:
+    duration = _video_duration(container)
+    container.close()
+    if duration <= 0:
         print(f"Error: could not read video properties from '{args.video_path}'", file=sys.stderr)
-        cap.release()
         sys.exit(1)
 
-    duration = total_frames / fps
     os.makedirs(args.output_dir, exist_ok=True)
+    # Terminals line-buffer stdout, costing a write per path; flush in batches instead
+    sys.stdout.reconfigure(line_buffering=False)
+    print_path = _print_batched(PRINT_BATCH_SIZE)
 
-    extracted = 0
-    timestamp = 0.0
-    while timestamp < duration:
-        frame_number = int(timestamp * fps)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        filename = f"frame_{timestamp:04.0f}s.{args.format}"
-        filepath = os.path.join(args.output_dir, filename)
-        cv2.imwrite(filepath, frame)
-        print(filepath)
-        extracted += 1
-        timestamp += args.interval
-
-    cap.release()
+    # Each time is computed directly rather than accumulated, so long runs don't drift
+    timestamps = np.arange(0.0, duration, args.interval).tolist()
+    prefix = os.path.join(args.output_dir, "frame_")
+    slices = _slice_samples(
+        timestamps, max(1, args.workers),
+        lambda timestamp: _frame_path(prefix, timestamp, args.format),
+    )
+    workers = len(slices)
+    if workers <= 1:
+        if args.backend == "cv2":
+            # Leave a core for decoding, which runs alongside the encoder
+            _configure_cv2(max(1, (os.cpu_count() or 1) - 1))
+        extracted = _extract_range(
+            args.video_path, args.hwaccel, prefix, args.format, args.backend,
+            timestamps, print_path,
+        )
+    else:
+        # Each worker opens the video itself and decodes a contiguous slice of
+        # the sample times; paths are printed in order as slices finish
+        extract = functools.partial(
+            _extract_range_paths, args.video_path, args.hwaccel, prefix, args.format, args.backend
+        )
+        extracted = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for written in executor.map(extract, slices):
+                for filepath in written:
+                    print_path(filepath)
+                extracted += len(written)
 
     video_name = os.path.basename(args.video_path)
     print(
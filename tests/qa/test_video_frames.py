@@ -0,0 +1,156 @@
+"""Unit tests for src/qa/tools/video_frames.py frame sampling and slicing.
+
+Each test encodes a tiny clip with PyAV whose frames carry their own index
+as a flat luma level, samples it, and asserts which frame each sample time
+returned. Clips cover streams that start after 0 and sparse keyframes,
+in both MP4 and MPEG-TS, whose seeks can land past their target.
+
+Slicing tests check how sample times are split across --workers processes.
+
+Skipped when PyAV, numpy or (for the clips) the libx264 encoder is not available.
+"""
+
+import sys
+import tempfile
+import unittest
+from fractions import Fraction
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "qa" / "tools"))
+
+try:
+    import av
+    import numpy as np
+
+    import video_frames
+except ImportError:
+    av = None
+
+FPS = 10
+SECONDS = 10
+WIDTH, HEIGHT = 64, 48
+
+
+def make_clip(path, start=0.0, gop=FPS):
+    """Encode SECONDS of FPS video starting at start seconds, a keyframe every gop frames.
+
+    Frame i is flat with luma 16 + 2 * i; x264 at qp 0 keeps that exact.
+    """
+    container = av.open(str(path), "w")
+    stream = container.add_stream("libx264", rate=FPS)
+    stream.width, stream.height, stream.pix_fmt = WIDTH, HEIGHT, "yuv420p"
+    stream.codec_context.time_base = Fraction(1, FPS)
+    stream.codec_context.options = {
+        "qp": "0", "g": str(gop), "keyint_min": str(gop), "sc_threshold": "0", "bf": "0",
+    }
+    for i in range(FPS * SECONDS):
+        planes = np.full((HEIGHT * 3 // 2, WIDTH), 128, np.uint8)
+        planes[:HEIGHT] = 16 + 2 * i
+        frame = av.VideoFrame.from_ndarray(planes, format="yuv420p")
+        frame.pts = i + round(start * FPS)
+        frame.time_base = Fraction(1, FPS)
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+def frame_time(luma):
+    """Return the time, from the start of the clip, of the frame with this luma."""
+    return (int(luma) - 16) // 2 / FPS
+
+
+@unittest.skipIf(av is None or "libx264" not in av.codecs_available, "needs PyAV with libx264")
+class SampleFramesCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def clip(self, name, **kwargs):
+        path = self.root / name
+        make_clip(path, **kwargs)
+        return str(path)
+
+    def iter_times(self, path, interval):
+        """Run iter_frames; return (sample time, time of the frame returned) pairs."""
+        return [
+            (round(timestamp, 6), frame_time(frame[0, 0]))
+            for timestamp, frame in video_frames.iter_frames(path, interval, "yuv420p")
+        ]
+
+    def sample_times(self, path, timestamps):
+        """Run _sample_frames from a fresh container, as each --workers process does."""
+        container = av.open(path)
+        self.addCleanup(container.close)
+        stream = container.streams.video[0]
+        return [
+            (timestamp, frame_time(frame.to_ndarray(format="yuv420p")[0, 0]))
+            for timestamp, frame in video_frames._sample_frames(container, stream, timestamps)
+        ]
+
+    def assert_exact(self, samples, count):
+        """Every sample time falls on a frame here, so each must return that frame."""
+        self.assertEqual(len(samples), count)
+        for timestamp, returned in samples:
+            self.assertAlmostEqual(returned, timestamp, places=6, msg=samples)
+
+    # ── streams starting after 0 ──────────────────────────────────────
+
+    def test_start_offset_mp4(self):
+        path = self.clip("offset.mp4", start=5.0)
+        self.assert_exact(self.iter_times(path, 2.0), 5)
+
+    def test_start_offset_ts(self):
+        path = self.clip("offset.ts", start=5.0)
+        self.assert_exact(self.iter_times(path, 2.0), 5)
+
+    def test_start_offset_first_sample_seek(self):
+        path = self.clip("offset.ts", start=5.0)
+        self.assert_exact(self.sample_times(path, [6.5, 7.5, 8.5]), 3)
+
+    # ── sparse keyframes ──────────────────────────────────────────────
+
+    def test_sparse_keyframes_between_samples(self):
+        path = self.clip("sparse.mp4", gop=5 * FPS)
+        self.assert_exact(self.iter_times(path, 0.7), 15)
+
+    def test_sparse_keyframes_seek_lands_in_time(self):
+        # The TS demuxer's seek to 8s lands after it, and to 9.3s on packets
+        # that decode to nothing before the stream ends
+        path = self.clip("sparse.ts", start=5.0, gop=5 * FPS)
+        self.assert_exact(self.sample_times(path, [8.0, 9.0]), 2)
+        self.assert_exact(self.sample_times(path, [9.3]), 1)
+
+    def test_samples_between_frames_return_the_next_frame(self):
+        path = self.clip("sparse.ts", start=5.0, gop=5 * FPS)
+        for timestamp, returned in self.sample_times(path, [1.25, 4.95, 7.33]):
+            self.assertGreaterEqual(returned, timestamp)
+            self.assertLess(returned - timestamp, 1 / FPS)
+
+
+@unittest.skipIf(av is None, "needs PyAV and numpy")
+class SliceSamplesCase(unittest.TestCase):
+    def slices(self, timestamps, workers):
+        return video_frames._slice_samples(
+            timestamps, workers, lambda timestamp: video_frames._frame_path("f_", timestamp, "png")
+        )
+
+    def test_samples_sharing_a_file_stay_in_one_slice(self):
+        # 2.0s and 2.5s (and 3.0s and 3.5s, ...) share a frame_NNNNs name
+        timestamps = [0.5 * i for i in range(14)]
+        slices = self.slices(timestamps, 4)
+        self.assertEqual([t for chunk in slices for t in chunk], timestamps)
+        names = [{video_frames._frame_path("f_", t, "png") for t in chunk} for chunk in slices]
+        for first, second in zip(names, names[1:]):
+            self.assertFalse(first & second, slices)
+
+    def test_at_most_one_slice_per_file_name(self):
+        self.assertEqual(self.slices([0.0, 0.3], 4), [[0.0, 0.3]])
+        self.assertEqual(self.slices([0.0, 2.0, 4.0], 8), [[0.0], [2.0], [4.0]])
+        self.assertEqual(self.slices([], 4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()